@@ -1,21 +1,21 @@
 from __future__ import annotations
 
+import array
+import itertools
 import logging
-import threading
-import time
-from functools import partial
-from typing import ClassVar
+import operator
+import weakref
+from functools import partial, reduce
+from typing import Callable, ClassVar
 
-import numpy as np
 from ophyd.epics_motor import HomeEnum
-from ophyd.status import MoveStatus
+from ophyd.status import MoveStatus, StatusBase
 from ophyd.utils.epics_pvs import _wait_for_value
 from pcdsdevices.lasers import btms_config
 from pcdsdevices.lasers.btms_config import DestinationPosition, SourcePosition
 from pcdsdevices.lasers.btps import (BtpsSourceStatus, BtpsState,
                                      RangeComparison)
 from pydm import widgets as pydm_widgets
-from pydm.data_plugins import establish_connection
 from qtpy import QtCore, QtWidgets
 from typhos.positioner import TyphosPositionerWidget
 from typhos.suite import TyphosSuite
@@ -28,48 +28,181 @@ from .scene import BtmsStatusView
 
 logger = logging.getLogger(__name__)
 
+#: Valid BTMS destinations, for membership tests.
+_VALID_DESTINATION_SET: frozenset[DestinationPosition] = frozenset(
+    btms_config.valid_destinations
+)
+
+#: Valid BTMS destinations, sorted by destination index.
+_VALID_DESTINATIONS: tuple[DestinationPosition, ...] = tuple(
+    dest
+    for dest in sorted(DestinationPosition, key=lambda dest: dest.index)
+    if dest in _VALID_DESTINATION_SET
+)
+
+#: Combo box (text, data) items for the valid destinations.
+_VALID_DESTINATION_ITEMS: tuple[tuple[str, DestinationPosition], ...] = tuple(
+    (f"{dest.description} ({dest.value})", dest) for dest in _VALID_DESTINATIONS
+)
+
+#: All destinations, keyed by their name and description.
+_DESTINATIONS_BY_NAME: dict[str, DestinationPosition] = {
+    dest.name_and_desc: dest for dest in DestinationPosition
+}
+_DESTINATION_NAMES: tuple[str, ...] = tuple(_DESTINATIONS_BY_NAME)
+
+#: All destinations, keyed by their index (i.e., the N in LDN).
+_DESTINATIONS_BY_INDEX: dict[int, DestinationPosition] = {
+    dest.index: dest for dest in DestinationPosition
+}
+
+
+def _parse_int(text: str) -> int | None:
+    """
+    Parse ``text`` as a (signed) base-10 integer without raising.
+
+    Parameters
+    ----------
+    text : str
+        The text to parse.
+
+    Returns
+    -------
+    int or None
+        The integer, or None if ``text`` does not represent one.
+    """
+    stripped = text.strip()
+    digits = stripped[1:] if stripped[:1] in ("+", "-") else stripped
+    # isdecimal() accepts exactly the digits int() does; isdigit() would also
+    # let through characters such as superscripts that int() rejects.
+    if not digits.isdecimal():
+        return None
+    return int(stripped)
+
 
 class BtmsLaserDestinationLabel(pydm_widgets.PyDMLabel):
     new_destination: QtCore.Signal = QtCore.Signal(object)
 
+    #: Time to wait for the destination to settle before emitting [ms]
+    emit_delay_ms: ClassVar[int] = 50
+
     def __init__(self, *args, **kwargs):
+        self._last_raw_text = None
+        self._last_ld = None
         super().__init__(*args, **kwargs)
         self._destination = None
+        self._pending_destination = None
+        # Sentinel: the first destination is always emitted
+        self._emitted_destination = object()
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.emit_delay_ms)
+        self._emit_timer.timeout.connect(self._emit_destination)
+
+    def _queue_destination(self, destination: DestinationPosition | None) -> None:
+        """Emit ``new_destination`` after a short delay, with the latest value."""
+        self._pending_destination = destination
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    @QtCore.Slot()
+    def _emit_destination(self) -> None:
+        """Emit the pending destination, if it changed since the last one."""
+        destination = self._pending_destination
+        if destination == self._emitted_destination:
+            return
+
+        self._emitted_destination = destination
+        self.new_destination.emit(destination)
 
     @property
     def destination(self) -> DestinationPosition | None:
         return self._destination
 
     def setText(self, text: str):
-        try:
-            ld = int(text)
-        except ValueError:
+        if text == self._last_raw_text:
+            return
+
+        self._last_raw_text = text
+        ld = _parse_int(text)
+        if ld is None:
+            self._last_ld = None
             return super().setText(f"(Unknown: {text})")
 
+        if ld == self._last_ld:
+            # Unchanged destination; the label already shows it
+            return
+
+        self._last_ld = ld
+
         if ld == 0:
             text = "Unknown"
             self._destination = None
-            self.new_destination.emit(None)
-        elif ld < 0:
+            self._queue_destination(None)
+        elif ld not in _DESTINATIONS_BY_INDEX:
             text = "(Misconfiguration)"
             self._destination = None
-            self.new_destination.emit(None)
+            self._queue_destination(None)
         else:
-            pos = DestinationPosition.from_index(ld)
+            pos = _DESTINATIONS_BY_INDEX[ld]
             text = f"→ {pos.description} (LD{ld})"
             self._destination = pos
-            self.new_destination.emit(pos)
+            self._queue_destination(pos)
 
         return super().setText(text)
 
 
+class BtmsVisibleByteIndicator(pydm_widgets.PyDMByteIndicator):
+    """
+    A byte indicator that is only subscribed to its channel while shown.
+
+    Hiding the widget clears its channel; showing it again restores it.
+    """
+
+    def __init__(self, *args, init_channel: str | None = None, **kwargs):
+        super().__init__(*args, init_channel=init_channel, **kwargs)
+        self._shown_channel = init_channel or ""
+
+    def set_shown_channel(self, channel: str) -> None:
+        """Set the channel to be connected to whenever this is shown."""
+        self._shown_channel = channel
+        if self.isVisible():
+            self.channel = channel
+
+    def showEvent(self, event):
+        if self._shown_channel and self.channel != self._shown_channel:
+            self.channel = self._shown_channel
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.channel:
+            self._shown_channel = self.channel
+            self.channel = ""
+
+
 class BtmsDestinationComboBox(QtWidgets.QComboBox):
     def __init__(self, parent: QtWidgets.QWidget | None = None, **kwargs):
         super().__init__(parent, **kwargs)
 
-        for dest in sorted(DestinationPosition, key=lambda dest: dest.index):
-            if dest in btms_config.valid_destinations:
-                self.addItem(f"{dest.description} ({dest.value})", dest)
+        # Populate the model without per-item signals or popup repaints
+        view = self.view()
+        self.blockSignals(True)
+        view.setUpdatesEnabled(False)
+        try:
+            for text, dest in _VALID_DESTINATION_ITEMS:
+                self.addItem(text, dest)
+        finally:
+            view.setUpdatesEnabled(True)
+            self.blockSignals(False)
+
+
+def _remove_watch_callback(move_status: MoveStatus, callback: Callable) -> None:
+    """Remove a callback previously registered with ``move_status.watch()``."""
+    # ophyd offers no public API to remove a watch() callback
+    watchers = getattr(move_status, "_watchers", None) or []
+    if callback in watchers:
+        watchers.remove(callback)
 
 
 class QMoveStatus(QtCore.QObject):
@@ -79,10 +212,13 @@ class QMoveStatus(QtCore.QObject):
     def __init__(self, move_status: MoveStatus):
         super().__init__()
         self.move_status = move_status
+        self._done = False
         move_status.watch(self._watch_callback)
         move_status.callbacks.append(self._finished_callback)
 
     def _watch_callback(self, fraction: float | None = None, **kwargs):
+        if self._done:
+            return
         if fraction is not None:
             percent = 1.0 - fraction
             self.percent_changed.emit(percent)
@@ -91,42 +227,126 @@ class QMoveStatus(QtCore.QObject):
                 self.finished_moving.emit()
 
     def _finished_callback(self, fraction: float | None = None, **kwargs):
+        self._done = True
+        _remove_watch_callback(self.move_status, self._watch_callback)
         self.percent_changed.emit(1.0)
         self.finished_moving.emit()
 
 
+class _IndexedCallback:
+    """
+    An ophyd status callback that forwards to a method with an axis index.
+
+    Only a weak reference to the method's object is held, as the statuses
+    may outlive it.
+    """
+
+    __slots__ = ("_method", "index")
+
+    def __init__(self, method: Callable, index: int):
+        self._method = weakref.WeakMethod(method)
+        self.index = index
+
+    def __call__(self, *args, **kwargs):
+        method = self._method()
+        if method is not None:
+            method(self.index, *args, **kwargs)
+
+
 class QCombinedMoveStatus(QtCore.QObject):
     move_statuses: list[MoveStatus]
-    initials: tuple[float, ...]
-    percents: tuple[float, ...]
-    currents: tuple[float, ...]
-    targets: tuple[float, ...]
     status_changed = QtCore.Signal(float, list, list)  # List[float]
     finished_moving = QtCore.Signal()
 
+    #: Minimum time between ``status_changed`` emissions while moving [ms]
+    update_interval_ms: ClassVar[int] = 50
+
     def __init__(self, move_statuses: list[MoveStatus]):
         super().__init__()
         if not move_statuses:
             raise ValueError("At least one MoveStatus required")
 
-        self.move_statuses = list(st for st in move_statuses)
-        self.initials = tuple([0.0] * len(move_statuses))
-        self.targets = tuple([0.0] * len(move_statuses))
-        self.currents = tuple([0.0] * len(move_statuses))
-        self.percents = tuple([0.0] * len(move_statuses))
-        self.lock = threading.Lock()
-        self._finished_count = 0
+        self.move_statuses = list(move_statuses)
+        # Fixed-size per-axis storage, written in place by the callbacks:
+        zeros = [0.0] * len(self.move_statuses)
+        self._initials = array.array("d", zeros)
+        self._targets = array.array("d", zeros)
+        self._currents = array.array("d", zeros)
+        self._percents = array.array("d", zeros)
+        # next() on itertools.count is atomic under the GIL, so counting
+        # finished statuses from several callback threads needs no lock.
+        self._finished_counter = itertools.count(1)
+        self._done = False
+        self._emitted_finished = False
+        self._emitted_percent = -1
+        self._dirty = False
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.update_interval_ms)
+        self._update_timer.timeout.connect(self._flush)
+        self._callbacks = []
         for idx, move_status in enumerate(self.move_statuses):
-            move_status.watch(partial(self._watch_callback, idx))
-            move_status.callbacks.append(partial(self._finished_callback, idx))
+            watch_callback = _IndexedCallback(self._watch_callback, idx)
+            finished_callback = _IndexedCallback(self._finished_callback, idx)
+            move_status.watch(watch_callback)
+            move_status.callbacks.append(finished_callback)
+            self._callbacks.append((watch_callback, finished_callback))
+
+    def dispose(self) -> None:
+        """
+        Detach from the underlying statuses and stop emitting signals.
+
+        Call from the GUI thread once this status is no longer of interest.
+        """
+        self._done = True
+        self._dirty = False
+        self._update_timer.stop()
+        self._detach_watchers()
+        # Finished callbacks are left registered: ophyd may be iterating over
+        # them on its callback thread, and they only hold this object weakly
+        # and return early once it is done.
+        self._callbacks.clear()
+
+        for signal in (self.status_changed, self.finished_moving):
+            try:
+                signal.disconnect()
+            except (TypeError, RuntimeError):
+                # Nothing connected
+                ...
+
+    def _detach_watchers(self) -> None:
+        """Remove our watch callbacks from the underlying statuses."""
+        for move_status, (watch_callback, _) in zip(
+            self.move_statuses, self._callbacks
+        ):
+            _remove_watch_callback(move_status, watch_callback)
+
+    @property
+    def initials(self) -> tuple[float, ...]:
+        """Initial position of each axis."""
+        return tuple(self._initials)
+
+    @property
+    def targets(self) -> tuple[float, ...]:
+        """Target position of each axis."""
+        return tuple(self._targets)
+
+    @property
+    def currents(self) -> tuple[float, ...]:
+        """Current position of each axis."""
+        return tuple(self._currents)
+
+    @property
+    def percents(self) -> tuple[float, ...]:
+        """Last reported fraction of each axis."""
+        return tuple(self._percents)
 
     @property
     def current_deltas(self) -> list[float]:
         """Delta of current position to target position."""
         return [
             abs(target - current)
-            for current, target in zip(self.currents, self.targets)
-            if current is not None and target is not None
+            for current, target in zip(self._currents, self._targets)
         ]
 
     @property
@@ -134,8 +354,7 @@ class QCombinedMoveStatus(QtCore.QObject):
         """Delta of initial position to target position."""
         return [
             abs(target - initial)
-            for initial, target in zip(self.initials, self.targets)
-            if initial is not None and target is not None
+            for initial, target in zip(self._initials, self._targets)
         ]
 
     def _watch_callback(
@@ -148,29 +367,67 @@ class QCombinedMoveStatus(QtCore.QObject):
         target: float | None = None,
         **kwargs,
     ):
-        with self.lock:
-            if self._finished_count == len(self.move_statuses):
-                return
+        if self._done:
+            return
+
+        # Only the callbacks of status ``index`` write to slot ``index``, and
+        # single-item array assignment is atomic under the GIL, so axes do not
+        # need to serialize on a shared lock here.
+        if initial is not None:
+            self._initials[index] = initial
+        if target is not None:
+            self._targets[index] = target
+        if current is not None:
+            self._currents[index] = current
+        if fraction is not None:
+            self._percents[index] = fraction
+
+        if initial is None and target is None and current is None:
+            # Fraction-only updates do not change the overall status
+            return
 
-            if initial is not None:
-                initials = list(self.initials)
-                initials[index] = initial
-                self.initials = tuple(initials)
-            if target is not None:
-                targets = list(self.targets)
-                targets[index] = target
-                self.targets = tuple(targets)
-            if current is not None:
-                currents = list(self.currents)
-                currents[index] = current
-                self.currents = tuple(currents)
-            if fraction is not None:
-                percents = list(self.percents)
-                percents[index] = fraction
-                self.percents = tuple(percents)
-
-            current_deltas = self.current_deltas
-            initial_deltas = self.initial_deltas
+        if not self._dirty:
+            # Coalesce updates: emit at most once per timer interval.  The
+            # timer lives in the GUI thread, so it has to be started there.
+            self._dirty = True
+            QtCore.QMetaObject.invokeMethod(
+                self._update_timer, "start", QtCore.Qt.QueuedConnection
+            )
+
+    def _finished_callback(self, index: int, /, fraction: float | None = None, **kwargs):
+        if self._done:
+            # Disposed of, or already finished
+            return
+        # This axis is done; late watch callbacks from it are of no interest
+        _remove_watch_callback(self.move_statuses[index], self._callbacks[index][0])
+        if next(self._finished_counter) == len(self.move_statuses):
+            self._done = True
+            self._detach_watchers()
+            QtCore.QMetaObject.invokeMethod(
+                self._update_timer, "stop", QtCore.Qt.QueuedConnection
+            )
+            self._update_status(finished=True)
+
+    @QtCore.Slot()
+    def _flush(self) -> None:
+        """Emit the latest status after coalescing watch callbacks."""
+        if not self._dirty or self._done:
+            return
+
+        # Clear the flag before reading so that any update arriving while we
+        # compute re-arms the timer.
+        self._dirty = False
+        self._update_status(finished=False)
+
+    def _update_status(self, finished: bool) -> None:
+        """Emit the overall move status, shared by the ophyd callbacks."""
+        current_deltas = self.current_deltas
+        initial_deltas = self.initial_deltas
+
+        if finished:
+            self.status_changed.emit(1.0, current_deltas, initial_deltas)
+            self._emit_finished()
+            return
 
         if not current_deltas or not initial_deltas:
             return
@@ -178,22 +435,24 @@ class QCombinedMoveStatus(QtCore.QObject):
         try:
             current_sum = sum(current_deltas)
             final_sum = sum(initial_deltas)
-            overall = 1.0 - np.clip(current_sum / final_sum, 0, 1)
+            overall = 1.0 - min(1.0, max(0.0, current_sum / final_sum))
         except Exception:
             overall = None
         else:
-            self.status_changed.emit(overall, current_deltas, initial_deltas)
+            # Only report progress in whole-percent steps
+            percent = int(overall * 100.0)
+            if percent != self._emitted_percent:
+                self._emitted_percent = percent
+                self.status_changed.emit(overall, current_deltas, initial_deltas)
             if overall >= (1.0 - 1e-6):
-                self.finished_moving.emit()
-
-    def _finished_callback(self, index: int, /, fraction: float | None = None, **kwargs):
-        with self.lock:
-            self._finished_count += 1
-            current_deltas = self.current_deltas
-            initial_deltas = self.initial_deltas
-
-        if self._finished_count == len(self.move_statuses):
-            self.status_changed.emit(1.0, current_deltas, initial_deltas)
+                self._emit_finished()
+
+    def _emit_finished(self) -> None:
+        """Emit ``finished_moving``, only the first time it is called."""
+        # Reaching 100% and the statuses completing both report the end of
+        # the move; only the first should reach the UI.
+        if not self._emitted_finished:
+            self._emitted_finished = True
             self.finished_moving.emit()
 
 
@@ -383,7 +642,11 @@ class BtmsLaserDestinationChoice(QtWidgets.QFrame):
             # self.current_dest_label: "BTPS:CurrentLD_RBV",
         }
 
-        self._setup_ui()
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _setup_ui(self):
         layout = QtWidgets.QHBoxLayout()
@@ -438,18 +701,24 @@ class BtmsStateDetails(QtWidgets.QFrame):
         self._state = None
         self._source = None
         self._dest = None
+        self._loading = True
 
         self._setup_ui()
 
         self.state = state
         self.source = source
         self.dest = dest
+        self._loading = False
+        self._update()
         self.setMinimumSize(800, 400)
 
     def _setup_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout()
         self.setLayout(layout)
-        self.text_edit = QtWidgets.QTextEdit()
+        # Plain text only: avoids QTextEdit's rich text document machinery
+        self.text_edit = QtWidgets.QPlainTextEdit()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
         layout.addWidget(self.text_edit)
 
     @property
@@ -459,6 +728,8 @@ class BtmsStateDetails(QtWidgets.QFrame):
 
     @state.setter
     def state(self, value: BtpsState | None):
+        if value is self._state:
+            return
         self._state = value
         self._update()
 
@@ -469,6 +740,8 @@ class BtmsStateDetails(QtWidgets.QFrame):
 
     @dest.setter
     def dest(self, value: DestinationPosition | None):
+        if value is self._dest:
+            return
         self._dest = value
         self._update()
 
@@ -479,10 +752,15 @@ class BtmsStateDetails(QtWidgets.QFrame):
 
     @source.setter
     def source(self, value: SourcePosition | None):
+        if value is self._source:
+            return
         self._source = value
         self._update()
 
     def _update(self):
+        if self._loading:
+            return
+
         source = self.source
         dest = self.dest
         state = self.state
@@ -494,13 +772,15 @@ class BtmsStateDetails(QtWidgets.QFrame):
         self.setWindowTitle(f"Checks for {source.name_and_desc} -> {dest.name_and_desc}")
 
         config = state.destinations[dest].sources[source]
-        summary = config.summarize_checks()
-        self.text_edit.setText("\n".join(summary))
+        self.text_edit.setPlainText("\n".join(config.summarize_checks()))
 
 
 class BtmsMoveConflictWidget(DesignerDisplay, QtWidgets.QFrame):
     filename: ClassVar[str] = "btms-move-request.ui"
 
+    #: Time to wait for each resolution request to complete [s]
+    resolution_timeout: ClassVar[float] = 5.0
+
     conflicts_label: QtWidgets.QLabel
     conflicts_list_widget: QtWidgets.QListWidget
     resolution_list_widget: QtWidgets.QListWidget
@@ -562,28 +842,52 @@ class BtmsMoveConflictWidget(DesignerDisplay, QtWidgets.QFrame):
     def _update_checks(self):
         """Update the issue list."""
         self.issues = self.state.sources[self.source].check_move_all(self.dest)
-        self.conflicts_list_widget.clear()
-        self.resolution_list_widget.clear()
-        for issue in self.issues:
-            self.conflicts_list_widget.addItem(f"{issue.__class__.__name__}: {issue}")
-            resolution = self.get_resolution_explanation(issue)
-            if resolution is not None:
-                self.resolution_list_widget.addItem(resolution)
+        conflicts = [f"{issue.__class__.__name__}: {issue}" for issue in self.issues]
+        resolutions = [
+            resolution
+            for resolution in (
+                self.get_resolution_explanation(issue) for issue in self.issues
+            )
+            if resolution is not None
+        ]
+
+        for list_widget, items in (
+            (self.conflicts_list_widget, conflicts),
+            (self.resolution_list_widget, resolutions),
+        ):
+            list_widget.setUpdatesEnabled(False)
+            list_widget.blockSignals(True)
+            try:
+                list_widget.clear()
+                list_widget.addItems(items)
+            finally:
+                list_widget.blockSignals(False)
+                list_widget.setUpdatesEnabled(True)
 
         can_fix = any(self.can_fix_issue(issue) for issue in self.issues)
         self.apply_resolution_button.setEnabled(can_fix)
 
-    def _resolve_all_thread(self):
-        """Attempt to resolve all issues."""
-        for issue in self.issues:
-            self.fix_issue(issue)
-        time.sleep(1.0)
+    def _resolution_finished(self, status: StatusBase) -> None:
+        """Callback from ophyd once all resolution requests have completed."""
+        if not status.success:
+            logger.warning("Failed to resolve all issues: %s", status.exception())
         util.run_in_gui_thread(self._update_checks)
 
     def _resolve_all(self):
         """Attempt to resolve all issues."""
-        self._thread = threading.Thread(target=self._resolve_all_thread, daemon=True)
-        self._thread.start()
+        statuses = [
+            status
+            for status in (self.fix_issue(issue) for issue in self.issues)
+            if status is not None
+        ]
+        if not statuses:
+            self._update_checks()
+            return
+
+        # Refresh the checks once every request completes, without tying up
+        # a thread while waiting:
+        combined = reduce(operator.and_, statuses)
+        combined.add_callback(self._resolution_finished)
 
     def can_fix_issue(self, conflict: Exception) -> bool:
         """Are we able to fix the issue in ``conflict`` automatically?"""
@@ -594,17 +898,34 @@ class BtmsMoveConflictWidget(DesignerDisplay, QtWidgets.QFrame):
 
         return False
 
-    def fix_issue(self, conflict: Exception) -> None:
-        """Try to fix the issue in ``conflict`` automatically."""
+    def fix_issue(self, conflict: Exception) -> StatusBase | None:
+        """
+        Try to fix the issue in ``conflict`` automatically.
+
+        Parameters
+        ----------
+        conflict : Exception
+            The exception.
+
+        Returns
+        -------
+        StatusBase or None
+            The status of the resolution request, if one was made.
+        """
         if isinstance(conflict, btms_config.MovingActiveSource):
             logger.warning("Closing shutter for %s", self.source)
-            self.state.sources[self.source].open_request.set(0)
-        elif isinstance(conflict, btms_config.PathCrossedError):
+            return self.state.sources[self.source].open_request.set(
+                0, timeout=self.resolution_timeout
+            )
+        if isinstance(conflict, btms_config.PathCrossedError):
             logger.warning("Closing shutter for %s", conflict.crosses_source)
-            self.state.sources[conflict.crosses_source].open_request.set(0)
-        elif isinstance(conflict, btms_config.DestinationInUseError):
+            return self.state.sources[conflict.crosses_source].open_request.set(
+                0, timeout=self.resolution_timeout
+            )
+        if isinstance(conflict, btms_config.DestinationInUseError):
             # Any idea?
             ...
+        return None
 
     def get_resolution_explanation(self, conflict: Exception) -> str | None:
         """
@@ -701,7 +1022,7 @@ class BtmsHomingScreen(DesignerDisplay, QtWidgets.QFrame):
 
     def _update_progress(self, thread):
         ndone = sum([int(th.succeeded()) for th in self._threads])
-        overall = np.clip(ndone / len(self._threads), 0, 1)
+        overall = min(1.0, max(0.0, ndone / len(self._threads)))
         self.progress_bar.setValue(int(100.0 * overall))
         if thread.succeeded():
             self._append_status_text(f'\nComplete: {thread._motor}')
@@ -726,7 +1047,9 @@ class BtmsHomingScreen(DesignerDisplay, QtWidgets.QFrame):
 
 
 class BtmsSourceValidWidget(QtWidgets.QFrame):
-    indicators: dict[DestinationPosition, list[pydm_widgets.PyDMByteIndicator]]
+    data_valid_indicator: BtmsVisibleByteIndicator
+    checks_ok_indicator: BtmsVisibleByteIndicator
+    yield_status_indicator: BtmsVisibleByteIndicator
 
     def __init__(
         self,
@@ -736,10 +1059,57 @@ class BtmsSourceValidWidget(QtWidgets.QFrame):
         self._device = None
         self._destination = None
         self._details = {}
-        self.indicators = {}
         super().__init__(parent, **kwargs)
         self.setLayout(QtWidgets.QHBoxLayout())
         self.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Maximum)
+        self._setup_ui()
+        self.setVisible(False)
+
+    def _setup_ui(self) -> None:
+        """
+        Create the indicator widgets.
+
+        A single set of indicators is retargeted to the channels of the
+        current destination, rather than having one set per destination.
+        """
+        self.data_valid_indicator = BtmsVisibleByteIndicator()
+        self.data_valid_indicator.setObjectName("data_valid_indicator")
+        data_label = QtWidgets.QLabel("Data")
+
+        self.checks_ok_indicator = BtmsVisibleByteIndicator()
+        self.checks_ok_indicator.setObjectName("checks_ok_indicator")
+        checks_label = QtWidgets.QLabel("Checks")
+
+        self.yield_status_indicator = BtmsVisibleByteIndicator()
+        self.yield_status_indicator.setObjectName("yield_status_indicator")
+        yield_label = QtWidgets.QLabel("Yielded")
+
+        for widget in [
+            yield_label,
+            self.yield_status_indicator,
+            *getattr(self.yield_status_indicator, "_indicators", []),
+        ]:
+            widget.setToolTip(
+                "Green if current destination hutch yielded control to others"
+            )
+
+        checks_button = QtWidgets.QToolButton()
+        checks_button.setText("?")
+        checks_button.setToolTip("Open details about checks...")
+        checks_button.clicked.connect(self._open_details)
+
+        layout = self.layout()
+        for widget in (
+            self.data_valid_indicator,
+            data_label,
+            self.checks_ok_indicator,
+            checks_label,
+            self.yield_status_indicator,
+            yield_label,
+            # Keep the checks button last:
+            checks_button,
+        ):
+            layout.addWidget(widget)
 
     @property
     def device(self) -> BtpsSourceStatus | None:
@@ -749,7 +1119,7 @@ class BtmsSourceValidWidget(QtWidgets.QFrame):
     @device.setter
     def device(self, device: BtpsSourceStatus):
         self._device = device
-        self.set_destination(self._destination)
+        self._update_indicators()
 
     @property
     def destination(self) -> DestinationPosition | None:
@@ -758,15 +1128,15 @@ class BtmsSourceValidWidget(QtWidgets.QFrame):
 
     @destination.setter
     def destination(self, destination: DestinationPosition):
-        self.set_destination(self._destination)
+        self.set_destination(destination)
 
-    def _open_details(
-        self, source: SourcePosition, dest: DestinationPosition
-    ) -> None:
+    def _open_details(self) -> None:
         device = self.device
-        if device is None:
+        dest = self.destination
+        if device is None or dest is None:
             return
 
+        source = device.source_pos
         details = BtmsStateDetails(
             None,
             state=device.parent,
@@ -776,82 +1146,51 @@ class BtmsSourceValidWidget(QtWidgets.QFrame):
         details.show()
         self._details[source] = details
 
-    def _get_indicators(
-        self, state: BtpsState, source: SourcePosition, dest: DestinationPosition
-    ) -> list[pydm_widgets.PyDMByteIndicator]:
-        """
-        Get the indicator widgets for a given source/dest combination.
-        """
-        conf = state.destinations[dest].sources[source]
-
-        data_valid = pydm_widgets.PyDMByteIndicator(
-            init_channel=channel_from_signal(conf.data_valid)
-        )
-        data_valid.setObjectName("data_valid_indicator")
-        data_label = QtWidgets.QLabel("Data")
-        for indicator in getattr(data_valid, "_indicators", []):
-            indicator.setToolTip(f"Green if data is valid ({dest})")
-        checks_ok = pydm_widgets.PyDMByteIndicator(
-            init_channel=channel_from_signal(conf.checks_ok)
-        )
-        checks_label = QtWidgets.QLabel("Checks")
-        for indicator in getattr(checks_ok, "_indicators", []):
-            checks_ok.setToolTip(f"Green if all checks are OK ({dest})")
-
-        dest_conf = state.destinations[dest]
-
-        yield_status = pydm_widgets.PyDMByteIndicator(
-            init_channel=channel_from_signal(dest_conf.yields_control)
-        )
-        yield_status.setObjectName("yield_status_indicator")
-        yield_label = QtWidgets.QLabel("Yielded")
-
-        for widget in [yield_label, yield_status, *getattr(yield_status, "_indicators", [])]:
-            widget.setToolTip(
-                "Green if current destination hutch yielded control to others"
-            )
-
-        checks_button = QtWidgets.QToolButton()
-        checks_button.setText("?")
-        checks_button.setToolTip("Open details about checks...")
-        checks_button.clicked.connect(partial(self._open_details, source, dest))
-
-        data_valid.setObjectName("checks_ok_indicator")
-        widgets = [
-            data_valid,
-            data_label,
-            checks_ok,
-            checks_label,
-            yield_status,
-            yield_label,
-            # Keep the checks button last:
-            checks_button,
-        ]
-        for widget in widgets:
-            # All widgets are added to the layout and selectively hidden/shown
-            # instead of changing channels on the fly
-            self.layout().addWidget(widget)
-        return widgets
-
     @QtCore.Slot(object)
     def set_destination(self, destination: DestinationPosition | None):
-        device = self._device
+        if destination == self._destination:
+            return
 
         self._destination = destination
+        self._update_indicators()
 
-        if device is None or destination is None:
+    def _update_indicators(self) -> None:
+        """Point the indicators at the current device and destination."""
+        device = self._device
+        dest = self._destination
+
+        if device is None or dest not in _VALID_DESTINATION_SET:
             self.setVisible(False)
             return
 
-        if not self.indicators:
-            self.indicators = {
-                dest: self._get_indicators(device.parent, device.source_pos, dest)
-                for dest in btms_config.valid_destinations
-            }
+        state = device.parent
+        dest_conf = state.destinations[dest]
+        conf = dest_conf.sources[device.source_pos]
 
-        for indicator_dest, indicators in self.indicators.items():
-            for indicator in indicators:
-                indicator.setVisible(indicator_dest == destination)
+        # Retarget everything in one pass rather than repainting per child
+        self.setUpdatesEnabled(False)
+        try:
+            for indicator, signal, tooltip in (
+                (
+                    self.data_valid_indicator,
+                    conf.data_valid,
+                    f"Green if data is valid ({dest})",
+                ),
+                (
+                    self.checks_ok_indicator,
+                    conf.checks_ok,
+                    f"Green if all checks are OK ({dest})",
+                ),
+            ):
+                indicator.set_shown_channel(channel_from_signal(signal))
+                for bit_indicator in getattr(indicator, "_indicators", []):
+                    bit_indicator.setToolTip(tooltip)
+
+            self.yield_status_indicator.set_shown_channel(
+                channel_from_signal(dest_conf.yields_control)
+            )
+        finally:
+            self.setUpdatesEnabled(True)
 
         self.setVisible(True)
 
@@ -910,6 +1249,11 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
         super().__init__(parent, **kwargs)
         self._prefix = prefix
         self._source_index = source_index
+        self._source_position = None
+        self._device = None
+        self._pending_device = None
+        self._pending_channels: dict[QtWidgets.QWidget, str] = {}
+        self._connect_scheduled = False
 
         self.pydm_widgets_to_suffix = {
             self.current_dest_label: "BTPS:CurrentLD_RBV",
@@ -923,7 +1267,15 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
         for widget in self.positioner_widgets:
             widget.ui.clear_error_button.setVisible(False)
 
+        self._move_status = None
+        self._last_progress = 0
+        self._pending_progress = 0
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(30)
+        self._progress_timer.timeout.connect(self._update_progress)
         self.target_dest_widget.move_requested.connect(self.move_request)
+        self.motion_stop_button.clicked.connect(self._on_move_stop)
         self.motion_progress_frame.setVisible(False)
 
         self.current_dest_label.new_destination.connect(self.new_destination.emit)
@@ -935,6 +1287,7 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
         self.save_centroid_nominal_button.clicked.connect(self.save_centroid_nominal)
         self.motion_home_button.clicked.connect(self.show_home)
         self._camera_process = None
+        self._motors_shown = None
         self._expert_mode = None
         self.expert_mode = expert_mode
 
@@ -949,11 +1302,11 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
             delta,
         )
         range_device.nominal.put(value)
-        low_value = range_device.low.get()
-        high_value = range_device.high.get()
-        if float(low_value) >= (value - delta) or low_value == 0.0:
+        low_value = float(range_device.low.get())
+        high_value = float(range_device.high.get())
+        if low_value >= (value - delta) or low_value == 0.0:
             range_device.low.put(value - delta)
-        if float(range_device.high.get()) <= (value + delta) or high_value == 0.0:
+        if high_value <= (value + delta) or high_value == 0.0:
             range_device.high.put(value + delta)
 
     def _save_nominal(self, dest: DestinationPosition) -> None:
@@ -1089,20 +1442,16 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
         if dest is not None:
             return dest
 
-        destinations = {
-            dest.name_and_desc: dest
-            for dest in DestinationPosition
-        }
         dest_text, ok = QtWidgets.QInputDialog.getItem(
             self,
             "Select the destination to save nominal positions to",
             "Destinations:",
-            tuple(destinations),
+            _DESTINATION_NAMES,
             0,
             False,
         )
         if ok:
-            return destinations[dest_text]
+            return _DESTINATIONS_BY_NAME[dest_text]
         return None
 
     def save_motor_nominal(self):
@@ -1149,6 +1498,12 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
         )
 
     def show_motors(self, show: bool):
+        show = bool(show)
+        if show == self._motors_shown:
+            # Avoid needless relayouts of the (large) main window
+            return
+        self._motors_shown = show
+
         for motor in self.positioner_widgets:
             motor.setVisible(show)
 
@@ -1177,31 +1532,94 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
         if device is None:
             return
 
-        def stop_all():
-            for st in status:
-                try:
-                    st.device.stop()
-                except Exception:
-                    logger.exception("Failed to stop device %s", st.device.name)
-
-        def finished_moving():
-            self.motion_progress_frame.setVisible(False)
+        self._reset_progress()
 
-        def update(overall_percent: float, current_deltas: list[float], initial_deltas: list[float]):
-            self.motion_progress_widget.setValue(int(overall_percent * 100.0))
-
-        self.motion_progress_widget.setValue(0)
+        if self._move_status is not None:
+            # Superseded; stop the previous status from reporting to us
+            self._move_status.dispose()
 
         status = device.set_with_movestatus(target, check=False)
         self._move_status = QCombinedMoveStatus(list(status))
-        self._move_status.status_changed.connect(update)
-        self._move_status.finished_moving.connect(finished_moving)
+        # Status updates arrive from ophyd's callback threads; always queue
+        # them onto the GUI thread.
+        self._move_status.status_changed.connect(
+            self._on_move_update, QtCore.Qt.QueuedConnection
+        )
+        self._move_status.finished_moving.connect(
+            self._on_move_finished, QtCore.Qt.QueuedConnection
+        )
 
         show_progress = not any(st.done for st in self._move_status.move_statuses)
-        self.motion_stop_button.clicked.connect(stop_all)
         self.motion_progress_frame.setVisible(show_progress)
         return self._move_status
 
+    @QtCore.Slot()
+    def _on_move_stop(self):
+        """Stop all motors of the move in progress."""
+        if self._move_status is None:
+            return
+
+        for st in self._move_status.move_statuses:
+            try:
+                st.device.stop()
+            except Exception:
+                logger.exception("Failed to stop device %s", st.device.name)
+
+    @QtCore.Slot()
+    def _on_move_finished(self):
+        """The move in progress finished."""
+        self.motion_progress_frame.setVisible(False)
+
+        move_status = self.sender()
+        if move_status is None:
+            return
+
+        # Break the link from the status to this widget
+        try:
+            move_status.status_changed.disconnect(self._on_move_update)
+            move_status.finished_moving.disconnect(self._on_move_finished)
+        except (TypeError, RuntimeError):
+            # Already disconnected
+            ...
+
+    @QtCore.Slot(float, list, list)
+    def _on_move_update(
+        self,
+        overall_percent: float,
+        current_deltas: list[float],
+        initial_deltas: list[float],
+    ):
+        """Progress update from the move in progress."""
+        if not self.motion_progress_widget.isVisible():
+            # Hidden source widget (or progress frame); nothing to repaint
+            return
+
+        progress = int(overall_percent * 100.0)
+        if progress == self._last_progress:
+            return
+
+        # Repaint the progress bar at most once per timer interval
+        self._pending_progress = progress
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @QtCore.Slot()
+    def _update_progress(self):
+        """Show the latest pending progress value."""
+        progress = self._pending_progress
+        if progress == self._last_progress:
+            # Changed and changed back again while the timer was running
+            return
+
+        self._last_progress = progress
+        self.motion_progress_widget.setValue(progress)
+
+    def _reset_progress(self):
+        """Reset the progress bar, dropping any pending update."""
+        self._progress_timer.stop()
+        self._last_progress = self._pending_progress = 0
+        self.motion_progress_widget.setValue(0)
+
     def move_request(self, target: DestinationPosition) -> QCombinedMoveStatus | None:
         """
         Request move of this source to the ``target`` DestinationPosition.
@@ -1211,13 +1629,7 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
         if device is None:
             return
 
-        def finished_moving():
-            self.motion_progress_frame.setVisible(False)
-
-        def update(overall_percent: float, individual_percents: list[float]):
-            self.motion_progress_widget.setValue(int(overall_percent * 100.0))
-
-        self.motion_progress_widget.setValue(0)
+        self._reset_progress()
 
         issues = device.check_move_all(target)
 
@@ -1274,7 +1686,9 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
     @property
     def source_position(self) -> SourcePosition:
         """The source index, LS(index)."""
-        return SourcePosition.from_index(self._source_index)
+        if self._source_position is None:
+            self._source_position = SourcePosition.from_index(self._source_index)
+        return self._source_position
 
     @QtCore.Property(int)
     def source_index(self) -> int:
@@ -1284,16 +1698,47 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
     @source_index.setter
     def source_index(self, source_index: int):
         self._source_index = source_index
+        self._source_position = None
 
+        # PyDM connects channels as they are assigned; record the new ones,
+        # skipping those that are unchanged, and assign them once shown.
+        source_prefix = self.source_prefix
         for widget, suffix in self.pydm_widgets_to_suffix.items():
-            widget.channel = f"ca://{self.source_prefix}{suffix}"
-            for channel in widget.channels() or []:
-                establish_connection(channel)
+            channel = f"ca://{source_prefix}{suffix}"
+            if widget.channel != channel:
+                self._pending_channels[widget] = channel
+            else:
+                self._pending_channels.pop(widget, None)
+
+        self._schedule_connect()
 
         self.source_name_label.setText(
             f"LS{source_index} ({self.source_position.description})"
         )
 
+    def _schedule_connect(self) -> None:
+        """Assign pending channels from the event loop, once shown."""
+        if self._connect_scheduled or not self._pending_channels:
+            return
+        if not self.isVisible():
+            # showEvent will schedule it
+            return
+        # Connect from the event loop so that the GUI can repaint first, and
+        # so that repeated source_index changes are coalesced
+        self._connect_scheduled = True
+        util.run_in_gui_thread(self._connect_channels)
+
+    def _connect_channels(self) -> None:
+        """Assign the channels changed since the last call."""
+        self._connect_scheduled = False
+        if not self.isVisible():
+            return
+
+        pending = self._pending_channels
+        self._pending_channels = {}
+        for widget, channel in pending.items():
+            widget.channel = channel
+
     @property
     def device(self) -> BtpsSourceStatus | None:
         """The device for the BTMS."""
@@ -1301,6 +1746,9 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
 
     @device.setter
     def device(self, device: BtpsSourceStatus):
+        if device is self._device:
+            return
+
         self._device = device
         self.target_dest_widget.device = device
         self.valid_widget.device = device
@@ -1313,10 +1761,33 @@ class BtmsSourceOverviewWidget(DesignerDisplay, QtWidgets.QFrame):
         self.lin_home_indicator.channel = f"ca://{self.linear_widget.device.prefix}.MSTA"
         self.rot_home_indicator.channel = f"ca://{self.rotary_widget.device.prefix}.MSTA"
         self.gon_home_indicator.channel = f"ca://{self.goniometer_widget.device.prefix}.MSTA"
-        self.near_x_label.channel = f"ca://{device.source_pos.near_field_camera_prefix}Stats2:CentroidX_RBV"
-        self.near_y_label.channel = f"ca://{device.source_pos.near_field_camera_prefix}Stats2:CentroidY_RBV"
-        self.far_x_label.channel = f"ca://{device.source_pos.far_field_camera_prefix}Stats2:CentroidX_RBV"
-        self.far_y_label.channel = f"ca://{device.source_pos.far_field_camera_prefix}Stats2:CentroidY_RBV"
+        source_pos = device.source_pos
+        near_stats = f"ca://{source_pos.near_field_camera_prefix}Stats2:"
+        far_stats = f"ca://{source_pos.far_field_camera_prefix}Stats2:"
+        self.near_x_label.channel = near_stats + "CentroidX_RBV"
+        self.near_y_label.channel = near_stats + "CentroidY_RBV"
+        self.far_x_label.channel = far_stats + "CentroidX_RBV"
+        self.far_y_label.channel = far_stats + "CentroidY_RBV"
+
+    def set_device_when_shown(self, device: BtpsSourceStatus) -> None:
+        """
+        Set the device now if this widget is shown, or else once it is.
+
+        Binding a device creates positioner widgets and channel connections,
+        which hidden sources do not need yet.
+        """
+        if self.isVisible():
+            self._pending_device = None
+            self.device = device
+        else:
+            self._pending_device = device
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_connect()
+        if self._pending_device is not None:
+            device, self._pending_device = self._pending_device, None
+            self.device = device
 
 
 class BtmsDiagramWidget(DesignerDisplay, QtWidgets.QWidget):
@@ -1436,6 +1907,8 @@ class BtmsMain(DesignerDisplay, QtWidgets.QWidget):
         self.open_hutch_overview_button.clicked.connect(self.open_hutch_overview)
         self._btps_overview = None
         self._hutch_overview = None
+        self._pending_devices = []
+        self._device_generation = 0
         self.expert_mode_checkbox.clicked.connect(self._set_expert_mode)
         self._set_expert_mode(expert_mode)
 
@@ -1463,8 +1936,25 @@ class BtmsMain(DesignerDisplay, QtWidgets.QWidget):
         if device is None:
             return
 
-        for source in self.source_widgets:
-            source.device = device.sources[source.source_position]
+        # Bind one source per event loop iteration so that the first paint
+        # (and user input) is not held up by all of the positioner widgets.
+        self._pending_devices = [
+            (source, device.sources[source.source_position])
+            for source in self.source_widgets
+        ]
+        self._device_generation += 1
+        util.run_in_gui_thread(self._assign_next_device, self._device_generation)
+
+    def _assign_next_device(self, generation: int) -> None:
+        """Assign the next pending source device, then re-arm."""
+        if generation != self._device_generation or not self._pending_devices:
+            # Finished, or superseded by a new prefix
+            return
+
+        source, device = self._pending_devices.pop(0)
+        source.set_device_when_shown(device)
+        if self._pending_devices:
+            util.run_in_gui_thread(self._assign_next_device, generation)
 
     def show_graphics(self):
         if self.graphics_pushbutton.isChecked():
@@ -1,43 +1,75 @@
-import dataclasses
-from typing import Optional
+from __future__ import annotations
 
-from ophyd import EpicsSignal
-from pcdsdevices.lasers.btps import RangeComparison
+import functools
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple
+
+from pcdsdevices.lasers import btms_config
 
 from btms_ui.scene import DestinationPosition, SourcePosition
 from btms_ui.util import get_btps_device
 
+if TYPE_CHECKING:
+    from ophyd import EpicsSignal
+    from pcdsdevices.lasers.btps import RangeComparison
+
+#: Report what would change without writing anything
+dry_run = False
+
+
+_ophyd_cleaned_up = False
+
 
 def ophyd_cleanup():
     """Clean up ophyd - avoid teardown errors by stopping callbacks."""
+    global _ophyd_cleaned_up
+    if _ophyd_cleaned_up:
+        return
+    _ophyd_cleaned_up = True
+
     import ophyd
     dispatcher = ophyd.cl.get_dispatcher()
     if dispatcher is not None:
         dispatcher.stop()
 
 
-@dataclasses.dataclass
-class Config:
+class Config(NamedTuple):
     linear: Optional[float] = None
     rotary: Optional[float] = None
     goniometer: Optional[float] = None
 
 
+# Configuration for source/destination pairs without known positions
+_UNKNOWN_CONFIG = Config()
+
+
+# Keyed by (source.is_left, dest.is_top):
 default_rotary_positions = {
-    ("left", "up"): 45.6414,
-    ("left", "down"): 135.6510,
-    ("right", "up"): 315.085,
-    ("right", "down"): 225.12,
+    (True, True): 45.6414,
+    (True, False): 135.6510,
+    (False, True): 315.085,
+    (False, False): 225.12,
 }
 
 default_goniometer_positions = {
-    ("left", "up"): -0.4666,
-    ("left", "down"): -0.4276,
-    ("right", "up"): -0.28,
-    ("right", "down"): -0.3219,
+    (True, True): -0.4666,
+    (True, False): -0.4276,
+    (False, True): -0.28,
+    (False, False): -0.3219,
 }
 
 
+# Every installed (source, destination) pair, in the order they are configured
+PAIRS = tuple(
+    (source, dest)
+    for source in SourcePosition
+    if source in btms_config.valid_sources
+    for dest in DestinationPosition
+    if dest in btms_config.valid_destinations
+)
+
+
 # Bottom destinations (rough top centers, inside chamber)
 BOTTOM_PORTS = [
     1,
@@ -58,7 +90,16 @@ TOP_PORTS = [
     14,
 ]
 
+# 8.5" spacing per side
+# 215.9 mm port-to-port
+PORT_SPACING_MM = 215.9
+
+# Port number to (is top port, position along the chamber side)
+PORT_INDEX = {port: (False, idx) for idx, port in enumerate(BOTTOM_PORTS)}
+PORT_INDEX.update({port: (True, idx) for idx, port in enumerate(TOP_PORTS)})
 
+
+@functools.lru_cache(maxsize=None)
 def guess_position_for_port(source: SourcePosition, dest: DestinationPosition) -> float:
     """
     Make a guess at a linear stage position given the destination port number.
@@ -73,178 +114,190 @@ def guess_position_for_port(source: SourcePosition, dest: DestinationPosition) -
     float
         Linear stage position guess.
     """
-    # 8.5" spacing per side
-    # 215.9 mm port-to-port
-    port_spacing_mm = 215.9
-    # TMO IP1 is always known:
-    if source.is_left:
-        top_start = full_config[SourcePosition.ls1][DestinationPosition.ld8].linear
-    else:
-        top_start = full_config[SourcePosition.ls8][DestinationPosition.ld8].linear
-
-    assert top_start is not None
-    bottom_start = top_start + port_spacing_mm / 2
-
-    dest_index = dest.index
-    if dest_index in TOP_PORTS:
-        port_index = TOP_PORTS.index(dest_index)
-        start = top_start
-    else:
-        port_index = BOTTOM_PORTS.index(dest_index)
-        start = bottom_start
-
-    return start + port_index * port_spacing_mm
+    is_top, port_index = PORT_INDEX[dest.index]
+    start = (_TOP_START if is_top else _BOTTOM_START)[source.is_left]
+    return start + port_index * PORT_SPACING_MM
 
 
 full_config = {
     # LS1 - bay 1
-    SourcePosition.ls1: {
-        DestinationPosition.ld2: Config(
-            # "TMO IP3",
-            linear=None,
-            rotary=None,
-        ),
-        DestinationPosition.ld4: Config(
-            # "RIX ChemRIXS",
-            linear=787.9045,
-            rotary=135.6510,
-            goniometer=-0.4276,
-        ),
-        DestinationPosition.ld6: Config(
-            # "RIX QRIXS",
-            linear=None,
-            rotary=None,
-        ),
-        DestinationPosition.ld8: Config(
-            # "TMO IP1",
-            linear=46.4244,
-            rotary=45.6414,
-            goniometer=-0.4666,
-        ),
-        DestinationPosition.ld9: Config(
-            # "Laser Lab",
-            linear=None,
-            rotary=None,
-        ),
-        DestinationPosition.ld10: Config(
-            # "TMO IP2",
-            linear=None,
-            rotary=None,
-        ),
-        DestinationPosition.ld14: Config(
-            # "XPP",
-            linear=1339.5865,
-            rotary=45.6566,
-            goniometer=-0.4394,
-        ),
-    },
+    (SourcePosition.ls1, DestinationPosition.ld2): Config(
+        # "TMO IP3",
+        linear=None,
+        rotary=None,
+    ),
+    (SourcePosition.ls1, DestinationPosition.ld4): Config(
+        # "RIX ChemRIXS",
+        linear=787.9045,
+        rotary=135.6510,
+        goniometer=-0.4276,
+    ),
+    (SourcePosition.ls1, DestinationPosition.ld6): Config(
+        # "RIX QRIXS",
+        linear=None,
+        rotary=None,
+    ),
+    (SourcePosition.ls1, DestinationPosition.ld8): Config(
+        # "TMO IP1",
+        linear=46.4244,
+        rotary=45.6414,
+        goniometer=-0.4666,
+    ),
+    (SourcePosition.ls1, DestinationPosition.ld9): Config(
+        # "Laser Lab",
+        linear=None,
+        rotary=None,
+    ),
+    (SourcePosition.ls1, DestinationPosition.ld10): Config(
+        # "TMO IP2",
+        linear=None,
+        rotary=None,
+    ),
+    (SourcePosition.ls1, DestinationPosition.ld14): Config(
+        # "XPP",
+        linear=1339.5865,
+        rotary=45.6566,
+        goniometer=-0.4394,
+    ),
     # LS5 - bay 3
-    SourcePosition.ls8: {
-        DestinationPosition.ld9: Config(
-            # "Laser Lab",
-            linear=252.860,
-            rotary=315.085,
-        ),
-    },
+    (SourcePosition.ls5, DestinationPosition.ld9): Config(
+        # "Laser Lab",
+        linear=252.860,
+        rotary=315.085,
+    ),
     # LS8 - bay 4
-    SourcePosition.ls8: {
-        DestinationPosition.ld2: Config(
-            # "TMO IP3",
-            linear=None,
-            rotary=None,
-        ),
-        DestinationPosition.ld4: Config(
-            # "RIX ChemRIXS",
-            linear=782.60952,
-            rotary=225.12,
-            goniometer=-0.3219,
-        ),
-        DestinationPosition.ld6: Config(
-            # "RIX QRIXS",
-            linear=None,
-            rotary=None,
-        ),
-        DestinationPosition.ld8: Config(
-            # "TMO IP1",
-            linear=31.95952,
-            rotary=315.085,
-            goniometer=-0.28,
-        ),
-        DestinationPosition.ld9: Config(
-            # "Laser Lab",
-            linear=None,
-            rotary=None,
-        ),
-        DestinationPosition.ld10: Config(
-            # "TMO IP2",
-            linear=None,
-            rotary=None,
-        ),
-        DestinationPosition.ld14: Config(
-            # "XPP",
-            linear=1329.95952,
-            rotary=315.107,
-            goniometer=-0.338,
-        ),
-    },
+    (SourcePosition.ls8, DestinationPosition.ld2): Config(
+        # "TMO IP3",
+        linear=None,
+        rotary=None,
+    ),
+    (SourcePosition.ls8, DestinationPosition.ld4): Config(
+        # "RIX ChemRIXS",
+        linear=782.60952,
+        rotary=225.12,
+        goniometer=-0.3219,
+    ),
+    (SourcePosition.ls8, DestinationPosition.ld6): Config(
+        # "RIX QRIXS",
+        linear=None,
+        rotary=None,
+    ),
+    (SourcePosition.ls8, DestinationPosition.ld8): Config(
+        # "TMO IP1",
+        linear=31.95952,
+        rotary=315.085,
+        goniometer=-0.28,
+    ),
+    (SourcePosition.ls8, DestinationPosition.ld9): Config(
+        # "Laser Lab",
+        linear=None,
+        rotary=None,
+    ),
+    (SourcePosition.ls8, DestinationPosition.ld10): Config(
+        # "TMO IP2",
+        linear=None,
+        rotary=None,
+    ),
+    (SourcePosition.ls8, DestinationPosition.ld14): Config(
+        # "XPP",
+        linear=1329.95952,
+        rotary=315.107,
+        goniometer=-0.338,
+    ),
 }
 
-
-def _put(signal: EpicsSignal, value: float):
-    current = signal.get()
-    if abs(current - value) > 1e-6:
-        print(f"-> Changing {signal.pvname} to {value}")
-        if not dry_run:
-            signal.put(value)
+# TMO IP1 is always known; keyed by source.is_left:
+_TOP_START = {
+    True: full_config[SourcePosition.ls1, DestinationPosition.ld8].linear,
+    False: full_config[SourcePosition.ls8, DestinationPosition.ld8].linear,
+}
+assert None not in _TOP_START.values()
+_BOTTOM_START = {
+    is_left: top_start + PORT_SPACING_MM / 2
+    for is_left, top_start in _TOP_START.items()
+}
 
 
-def _update(device: RangeComparison, value: float, delta: float):
-    _put(device.nominal, value)
-    _put(device.low, value - delta)
-    _put(device.high, value + delta)
+def _update(
+    targets: List[Tuple[EpicsSignal, float]],
+    device: RangeComparison,
+    value: Optional[float],
+    delta: float,
+):
+    if value is None:
+        # Neither known nor guessed; leave the device as-is
+        return
+    targets.append((device.nominal, value))
+    targets.append((device.low, value - delta))
+    targets.append((device.high, value + delta))
+
+
+def _put_all(targets: List[Tuple[EpicsSignal, float]]):
+    """Set all queued signals that differ and wait for them to complete."""
+    # Channel access gets are I/O bound; read the current values in parallel
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        currents = list(
+            executor.map(operator.methodcaller("get"), [sig for sig, _ in targets])
+        )
+
+    pending = []
+    for (signal, value), current in zip(targets, currents):
+        if current == value or abs(current - value) <= 1e-6:
+            continue
+        print(f"-> Changing {signal.pvname} to {value}")
+        pending.append((signal, value))
+
+    if dry_run or not pending:
+        return
+    statuses = [(signal, signal.set(value)) for signal, value in pending]
+    # Combine all of the put statuses and wait on them together
+    combined = functools.reduce(operator.and_, (status for _, status in statuses))
+    try:
+        combined.wait(timeout=30)
+    except Exception:
+        for signal, status in statuses:
+            if not (status.done and status.success):
+                print(f"!! Failed to set {signal.pvname}: {status}")
+        raise
 
 
 def set_all():
     btps = get_btps_device()
-
-    for source in SourcePosition:
-        for dest in DestinationPosition:
+    # Queue all writes; compare and apply them together at the end
+    targets: List[Tuple[EpicsSignal, float]] = []
+
+    for source, dest in PAIRS:
+        config = full_config.get((source, dest), _UNKNOWN_CONFIG)
+
+        # Fill in any unknowns with guesses
+        key = (source.is_left, dest.is_top)
+        guesses = {}
+        if config.linear is None:
+            guesses["linear"] = guess_position_for_port(source, dest)
+        if config.rotary is None:
+            guesses["rotary"] = default_rotary_positions[key]
+        if config.goniometer is None:
+            guesses["goniometer"] = default_goniometer_positions[key]
+        if guesses:
+            config = config._replace(**guesses)
+
+        print(source.name_and_desc, dest.name_and_desc, config)
+        if not dry_run:
             try:
-                config = full_config[source][dest]
+                device = btps.destinations[dest].sources[source]
             except KeyError:
-                config = Config(linear=None, rotary=None)
-
-            left_text = "left" if source.is_left else "right"
-            up_text = "up" if dest.is_top else "down"
-            key = (left_text, up_text)
-            guess_config = Config(
-                linear=guess_position_for_port(source, dest),
-                rotary=default_rotary_positions[key],
-                goniometer=default_goniometer_positions[key],
-            )
-
-            if config.linear is None:
-                config.linear = guess_config.linear
-            if config.rotary is None:
-                config.rotary = guess_config.rotary
-            if config.goniometer is None:
-                config.goniometer = guess_config.goniometer
-
-            print(source.name_and_desc, dest.name_and_desc, config)
-            if not dry_run:
-                try:
-                    device = btps.destinations[dest].sources[source]
-                except KeyError:
-                    print("No device for", dest, source)
-                    continue
-
-                _update(device.linear, config.linear, delta=5.0)
-                _update(device.rotary, config.rotary, delta=5.0)
-                _update(device.goniometer, config.goniometer, delta=5.0)
-
-
-try:
-    dry_run = False
-    set_all()
-finally:
-    ophyd_cleanup()
+                print("No device for", dest, source)
+                continue
+
+            _update(targets, device.linear, config.linear, delta=5.0)
+            _update(targets, device.rotary, config.rotary, delta=5.0)
+            _update(targets, device.goniometer, config.goniometer, delta=5.0)
+
+    _put_all(targets)
+
+
+if __name__ == "__main__":
+    try:
+        set_all()
+    finally:
+        ophyd_cleanup()